@@ -2,6 +2,8 @@ import spot
 import buddy
 import random
 import os
+import pickle
+import tempfile
 from benchmarks_statistics import compute_antichain, counterexample_based_statistics, \
     antichain_optimization_algorithm_statistics, compute_losing_payoffs
 from verification_algorithms import is_payoff_realizable, counterexample_based_algorithm
@@ -326,6 +328,41 @@ def intersection_example_objective_increase(k, negative_instance=False):
     return stats, aut, t, colors_map
 
 
+def _save_statistics(stats, stats_path):
+    """
+    Save the statistics on an automaton to stats_path. They are first written to a temporary file which then replaces
+    stats_path, so that an interrupted run does not leave a truncated file behind.
+    :param stats: the statistics on the automaton.
+    :param stats_path: path to the file in which the statistics are saved.
+    """
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(stats_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as stats_file:
+            pickle.dump(stats, stats_file, protocol=5)
+        os.replace(temp_path, stats_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _load_statistics(stats_path):
+    """
+    Load the statistics on an automaton saved to stats_path.
+    :param stats_path: path to the file in which the statistics are saved.
+    :return: the statistics, or None if they could not be loaded.
+    """
+
+    try:
+        with open(stats_path, "rb") as stats_file:
+            return pickle.load(stats_file)
+    except FileNotFoundError:
+        return None
+    except (EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError, IndexError):
+        print("--- could not load the statistics in " + stats_path + ", computing them again ---")
+        return None
+
+
 def random_automaton(nbr_vertices, density, nbr_objectives, proba_even_general, proba_even_0, positivity, name):
     """
     Construct a random instance of the PRV problem as follows. Create a generalized parity automaton (corresponding to
@@ -344,7 +381,10 @@ def random_automaton(nbr_vertices, density, nbr_objectives, proba_even_general,
     final automaton is saved to a random_automata/ folder in HOA format with the following name:
     "random-nbr_vertices-density-nbr_objectives-proba_even_general-proba_even_0-positivity-name.hoa". If this name
     already exists (and a random automaton with the required parameters has already been generated, we load this
-    automaton instead of generating a new one).
+    automaton instead of generating a new one). The statistics on the payoffs of the automaton (which do not depend on
+    the algorithms) are saved next to it with the same name and the .pkl extension so that they are not computed again
+    when the automaton is loaded. The call statistics of both algorithms contain running times and are always measured
+    again.
 
     :param nbr_vertices: number of vertices in the generated automaton.
     :param density: between 0 (single outgoing edge) and 1 (fully connected graph).
@@ -379,6 +419,8 @@ def random_automaton(nbr_vertices, density, nbr_objectives, proba_even_general,
     file_path = "random_automata/random-" + str(nbr_vertices) + "-" + str(density) + "-" + str(nbr_objectives) + "-" + \
                 str(proba_even_general) + "-" + str(proba_even_0) + "-" + str(positivity) + "-" + name + ".hoa"
 
+    stats_path = os.path.splitext(file_path)[0] + ".pkl"
+
     # if the automaton has already been generated
     if os.path.isfile(file_path):
         aut = None
@@ -386,10 +428,22 @@ def random_automaton(nbr_vertices, density, nbr_objectives, proba_even_general,
             aut = a
 
         print("--- automaton exists in random_automata/ ---")
-        print("--- computing payoff statistics ---")
-        antichain = compute_antichain(aut, nbr_objectives, colors_map, is_payoff_realizable)
-        all_possible_realizable, losing_payoffs = compute_losing_payoffs(aut, nbr_objectives, colors_map,
-                                                                         is_payoff_realizable)
+
+        # if its payoff statistics have also already been computed (files saved by older versions also contain the
+        # call statistics, only the payoff statistics are kept)
+        payoff_stats = _load_statistics(stats_path)
+        if payoff_stats is not None:
+            print("--- payoff statistics exist in random_automata/ ---")
+            payoff_stats = payoff_stats[:3]
+        else:
+            print("--- computing payoff statistics ---")
+            antichain = compute_antichain(aut, nbr_objectives, colors_map, is_payoff_realizable)
+            all_possible_realizable, losing_payoffs = compute_losing_payoffs(aut, nbr_objectives, colors_map,
+                                                                             is_payoff_realizable)
+            payoff_stats = [len(antichain), len(losing_payoffs), len(all_possible_realizable)]
+            _save_statistics(payoff_stats, stats_path)
+
+        # the call statistics contain running times and are measured again in the current environment
         print("--- computing counterexample algorithm statistics ---")
         _, ce_antichain_approximation, ce_exists_call_stats, ce_dominated_calls_stats, _ = \
             counterexample_based_statistics(aut, nbr_objectives, colors_map)
@@ -397,16 +451,13 @@ def random_automaton(nbr_vertices, density, nbr_objectives, proba_even_general,
         _, ao_antichain_approximation, ao_realizable_stats, ao_realizable_losing_stats = \
             antichain_optimization_algorithm_statistics(aut, nbr_objectives, colors_map, is_payoff_realizable)
 
-        stats = [len(antichain),
-                 len(losing_payoffs),
-                 len(all_possible_realizable),
-                 len(ce_antichain_approximation),
-                 ce_exists_call_stats,
-                 ce_dominated_calls_stats,
-                 len(ao_antichain_approximation),
-                 ao_realizable_stats,
-                 ao_realizable_losing_stats
-                 ]
+        stats = payoff_stats + [len(ce_antichain_approximation),
+                                ce_exists_call_stats,
+                                ce_dominated_calls_stats,
+                                len(ao_antichain_approximation),
+                                ao_realizable_stats,
+                                ao_realizable_losing_stats
+                                ]
 
         return stats, aut, nbr_objectives, colors_map
 
@@ -520,7 +571,9 @@ def random_automaton(nbr_vertices, density, nbr_objectives, proba_even_general,
              ]
 
     print("--- saving automaton ---")
-    # if the automaton is newly generated, save it
+    # if the automaton is newly generated, save it along with its payoff statistics
     aut.save(file_path)
 
+    _save_statistics(stats[:3], stats_path)
+
     return stats, aut, nbr_objectives, colors_map
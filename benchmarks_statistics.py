@@ -1,9 +1,67 @@
 import time
+import math
 from collections import deque, defaultdict
+from dataclasses import dataclass
 from verification_algorithms import smaller_than, generate_smaller_payoffs, counter_example_exists, \
     get_payoff_of_accepting_run, counter_example_dominated, add_payoff_to_antichain
 
 
+class Timer:
+    """
+    Context manager measuring the time spent in its body according to some clock (the perf counter by default). The
+    measured time is available in the elapsed attribute once the body is exited.
+    """
+
+    __slots__ = ("clock", "start", "elapsed")
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.start = None
+        self.elapsed = None
+
+    def __enter__(self):
+        self.start = self.clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = self.clock() - self.start
+
+
+@dataclass
+class CallStatistics:
+    """
+    Running statistics on the running time of the calls to some function, updated online with Welford's algorithm so
+    that the running time of each call does not need to be stored.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    sst: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def update(self, running_time):
+        """
+        Update the statistics with the running time of a new call.
+        :param running_time: the running time of the call.
+        """
+
+        self.count += 1
+        delta = running_time - self.mean
+        self.mean += delta / self.count
+        self.sst += delta * (running_time - self.mean)
+        self.min = min(self.min, running_time)
+        self.max = max(self.max, running_time)
+
+    @property
+    def variance(self):
+        """
+        :return: the sample variance of the running times (0 if there are less than two calls).
+        """
+
+        return self.sst / (self.count - 1) if self.count > 1 else 0.0
+
+
 def antichain_optimization_algorithm_statistics(automaton, nbr_objectives, colors_map, realizable):
     """
     The algorithm is as implemented in verification_algorithms, with new instructions to compute and return statistics.
@@ -15,8 +73,8 @@ def antichain_optimization_algorithm_statistics(automaton, nbr_objectives, color
     :param colors_map: maps each parity objective to the set of SPOT acceptance sets used to represent its priorities.
     :param realizable: function which decides if a (extended) payoff is realizable.
     :return: whether the PRV problem is satisfied, the approximation of the set of PO payoffs, a pair [number of calls,
-    list of running time] for the realizable function, and a similar pair for the realizable function when losing for
-    Player 0.
+    CallStatistics on their running time] for the realizable function, and a similar pair for the realizable function
+    when losing for Player 0.
     """
 
     maximal_payoff = tuple([1] * nbr_objectives)
@@ -29,13 +87,9 @@ def antichain_optimization_algorithm_statistics(automaton, nbr_objectives, color
 
     visited = defaultdict(int)
 
-    counter_realizable = 0
+    realizable_times = CallStatistics()
 
-    counter_realizable_losing = 0
-
-    realizable_times = []
-
-    realizable_losing_times = []
+    realizable_losing_times = CallStatistics()
 
     while queue:
 
@@ -43,33 +97,23 @@ def antichain_optimization_algorithm_statistics(automaton, nbr_objectives, color
 
         if not any(smaller_than(p, p_prime) for p_prime in pareto_optimal_payoffs):
 
-            start_time_process = time.process_time()
-
-            is_realizable = realizable(p, automaton, colors_map)
-
-            end_time_process = time.process_time()
+            with Timer(time.process_time) as timer:
+                is_realizable = realizable(p, automaton, colors_map)
 
-            counter_realizable += 1
-
-            realizable_times.append(end_time_process - start_time_process)
+            realizable_times.update(timer.elapsed)
 
             if is_realizable:
 
                 pareto_optimal_payoffs.append(p)
 
-                start_time_process = time.process_time()
-
-                is_realizable_losing = realizable(p, automaton, colors_map, losing_for_0=True)
-
-                end_time_process = time.process_time()
-
-                counter_realizable_losing += 1
+                with Timer(time.process_time) as timer:
+                    is_realizable_losing = realizable(p, automaton, colors_map, losing_for_0=True)
 
-                realizable_losing_times.append(end_time_process - start_time_process)
+                realizable_losing_times.update(timer.elapsed)
 
                 if is_realizable_losing:
-                    return False, pareto_optimal_payoffs, [counter_realizable, realizable_times], \
-                                                          [counter_realizable_losing, realizable_losing_times]
+                    return False, pareto_optimal_payoffs, [realizable_times.count, realizable_times], \
+                                                          [realizable_losing_times.count, realizable_losing_times]
             else:
 
                 for p_star in generate_smaller_payoffs(p):
@@ -80,8 +124,8 @@ def antichain_optimization_algorithm_statistics(automaton, nbr_objectives, color
 
                         visited[p_star] = 1
 
-    return True, pareto_optimal_payoffs, [counter_realizable, realizable_times], \
-                                         [counter_realizable_losing, realizable_losing_times]
+    return True, pareto_optimal_payoffs, [realizable_times.count, realizable_times], \
+                                         [realizable_losing_times.count, realizable_losing_times]
 
 
 def counterexample_based_statistics(automaton, nbr_objectives, colors_map):
@@ -94,53 +138,39 @@ def counterexample_based_statistics(automaton, nbr_objectives, colors_map):
     :param nbr_objectives: the number t of objectives of Player 1.
     :param colors_map: maps each parity objective to the set of SPOT acceptance sets used to represent its priorities.
     :return: whether the PRV problem is satisfied, the approximation of the set of PO payoffs, a pair [number of calls,
-    list of running time] for the counter_example_exists function, a similar pair for the counter_example_dominated
-    function, and the evolution of the size of the antichain at each iteration.
+    CallStatistics on their running time] for the counter_example_exists function, a similar pair for the
+    counter_example_dominated function, and the evolution at each iteration of the size of the antichain along with
+    the running time of the call to counter_example_exists in that iteration.
     """
 
     pareto_optimal_payoffs = []
 
-    counter_exists = 0
+    exists_times = CallStatistics()
 
-    counter_dominated = 0
-
-    exists_times = []
-
-    dominated_times = []
+    dominated_times = CallStatistics()
 
     approximation_evolution = []
 
     while True:
 
-        approximation_evolution.append(len(pareto_optimal_payoffs))
-
-        start_time_process = time.process_time()
-
-        a_counter_example_exists, accepting_run_counter_example = \
-            counter_example_exists(nbr_objectives, automaton, colors_map, pareto_optimal_payoffs)
+        with Timer(time.process_time) as timer:
+            a_counter_example_exists, accepting_run_counter_example = \
+                counter_example_exists(nbr_objectives, automaton, colors_map, pareto_optimal_payoffs)
 
-        end_time_process = time.process_time()
+        exists_times.update(timer.elapsed)
 
-        counter_exists += 1
-
-        exists_times.append(end_time_process - start_time_process)
+        approximation_evolution.append((len(pareto_optimal_payoffs), timer.elapsed))
 
         if a_counter_example_exists:
 
             counter_example_payoff = get_payoff_of_accepting_run(nbr_objectives, colors_map,
                                                                  accepting_run_counter_example)
 
-            start_time_process = time.process_time()
-
-            is_counter_example_dominated, accepting_run_dominating = counter_example_dominated(nbr_objectives,
-                                                                                               automaton, colors_map,
-                                                                                               counter_example_payoff)
-
-            end_time_process = time.process_time()
-
-            counter_dominated += 1
+            with Timer(time.process_time) as timer:
+                is_counter_example_dominated, accepting_run_dominating = \
+                    counter_example_dominated(nbr_objectives, automaton, colors_map, counter_example_payoff)
 
-            dominated_times.append(end_time_process - start_time_process)
+            dominated_times.update(timer.elapsed)
 
             if is_counter_example_dominated:
 
@@ -154,14 +184,14 @@ def counterexample_based_statistics(automaton, nbr_objectives, colors_map):
 
                 # a counter example is not dominated by another payoff, hence the instance is false
 
-                return False, pareto_optimal_payoffs, [counter_exists, exists_times], \
-                                                      [counter_dominated, dominated_times], approximation_evolution
+                return False, pareto_optimal_payoffs, [exists_times.count, exists_times], \
+                                                      [dominated_times.count, dominated_times], approximation_evolution
         else:
 
             # there are no counter examples, hence the instance is true
 
-            return True, pareto_optimal_payoffs, [counter_exists, exists_times], \
-                                                 [counter_dominated, dominated_times], approximation_evolution
+            return True, pareto_optimal_payoffs, [exists_times.count, exists_times], \
+                                                 [dominated_times.count, dominated_times], approximation_evolution
 
 
 def compute_antichain(automaton, nbr_objectives, colors_map, realizable):
@@ -1,8 +1,14 @@
 import statistics
 import time
-import ast
+import json
+import glob
+import multiprocessing
+import multiprocessing.connection
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import spot
 from benchmarks import *
+from benchmarks_statistics import Timer
 from verification_algorithms import antichain_optimization_algorithm, counterexample_based_algorithm
 
 try:
@@ -16,14 +22,246 @@ except FileExistsError:
     pass
 
 
-def run_benchmark(benchmark_type, save_file, parameters, nbr_points, range_start, range_end, range_step):
+class BenchmarkNotSupportedError(Exception):
+    pass
+
+
+def _setup_measurement_env():
+    """
+    Reduce the noise on the measured running times by setting the frequency governor of the CPU to performance,
+    disabling turbo boost and raising the priority of the process. The benchmarks are run even if some of these settings
+    cannot be applied (e.g. because of missing permissions). The affinity of the process is left untouched: the kernel
+    does not balance the load across cores isolated with the isolcpus kernel parameter, so the trials run in parallel
+    would all share a single isolated core.
+    :return: the previous frequency governor of each CPU and the previous turbo boost setting, to be restored by
+    _restore_measurement_env once the benchmarks are over.
+    """
+
+    previous_governors = {}
+    for governor_path in glob.glob("/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_governor"):
+        try:
+            with open(governor_path) as governor:
+                cpu = governor_path.split("/")[5][len("cpu"):]
+                previous_governors[cpu] = governor.read().strip()
+        except OSError:
+            pass
+
+    try:
+        with open("/sys/devices/system/cpu/intel_pstate/no_turbo") as no_turbo:
+            previous_no_turbo = no_turbo.read().strip()
+    except OSError:
+        previous_no_turbo = None
+
+    try:
+        subprocess.run(["cpupower", "frequency-set", "-g", "performance"], check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        print("--- could not set the CPU frequency governor to performance ---")
+
+    try:
+        with open("/sys/devices/system/cpu/intel_pstate/no_turbo", "w") as no_turbo:
+            no_turbo.write("1")
+    except OSError:
+        print("--- could not disable turbo boost ---")
+
+    try:
+        os.nice(-20)
+    except OSError:
+        print("--- could not raise the priority of the benchmarks ---")
+
+    return previous_governors, previous_no_turbo
+
+
+def _restore_measurement_env(previous_env):
+    """
+    Restore the frequency governor of each CPU and the turbo boost setting changed by _setup_measurement_env. The
+    priority of the process is not restored as it ends with the benchmarks.
+    :param previous_env: the previous settings, as returned by _setup_measurement_env.
+    """
+
+    previous_governors, previous_no_turbo = previous_env
+
+    for cpu, governor in previous_governors.items():
+        try:
+            subprocess.run(["cpupower", "-c", cpu, "frequency-set", "-g", governor], check=True,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except (OSError, subprocess.CalledProcessError):
+            print("--- could not restore the frequency governor of CPU " + cpu + " to " + governor + " ---")
+
+    if previous_no_turbo is not None:
+        try:
+            with open("/sys/devices/system/cpu/intel_pstate/no_turbo", "w") as no_turbo:
+                no_turbo.write(previous_no_turbo)
+        except OSError:
+            print("--- could not restore the turbo boost setting ---")
+
+
+def _nbr_available_cores():
+    """
+    :return: the number of cores the benchmarks are allowed to run on.
+    """
+
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count()
+
+
+def _timed_run(algorithm, args, results):
+    """
+    Runs the algorithm on the given arguments and sends its result along with its running time through results (or the
+    exception raised by the algorithm, if any).
+    :param algorithm: a verification algorithm.
+    :param args: the arguments of the algorithm.
+    :param results: connection through which the result is sent.
+    """
+
+    try:
+        with Timer(time.process_time) as process_timer, Timer() as perf_timer:
+            positivity = algorithm(*args)
+        results.send((positivity, process_timer.elapsed, perf_timer.elapsed))
+    except Exception as exception:
+        results.send(exception)
+
+
+def _run_in_fresh_process(algorithm, *args):
+    """
+    Runs the algorithm on the given arguments in a freshly forked process, so that the state of the memory allocator
+    (and of the caches of SPOT) at the start of the algorithm does not depend on the algorithms run before it.
+    :param algorithm: a verification algorithm.
+    :param args: the arguments of the algorithm.
+    :return: the result of the algorithm, its process time and its perf counter time.
+    """
+
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_timed_run, args=(algorithm, args, sender))
+    process.start()
+    sender.close()
+
+    # wait for either the result or the end of the process, which may die without sending anything (e.g. if it is
+    # killed or if SPOT crashes)
+    result_received = False
+    try:
+        multiprocessing.connection.wait([receiver, process.sentinel])
+        if receiver.poll():
+            result = receiver.recv()
+            result_received = True
+    except EOFError:
+        pass
+    finally:
+        receiver.close()
+
+    process.join()
+
+    if not result_received:
+        raise ChildProcessError("The process running " + algorithm.__name__ + " exited with code " +
+                                str(process.exitcode) + " without sending a result.")
+
+    if isinstance(result, Exception):
+        raise result
+
+    return result
+
+
+def _run_one_trial(j, benchmark_type, parameters, i):
+    """
+    Runs a single trial of run_benchmark: generates (or retrieves) the jth automaton for the value i of the variable
+    being evaluated and measures the running time of both algorithms on it. Both algorithms are run one after the other
+    so that they do not compete for the same core, each in its own process forked from the calling process. Trials are
+    independent from each other and can therefore be run in separate processes.
+    :param j: index of the trial, between 1 and nbr_points.
+    :param benchmark_type: should be in ["random", "intersection_vertices", "intersection_objectives"].
+    :param parameters: parameters to generate the automata in the benchmarks (see run_benchmark for expected format).
+    :param i: value of the variable being evaluated.
+    :return: j, stats, nbr, ce_times, ao_times where stats and nbr are as returned by the functions generating the
+    benchmarks and ce_times (resp. ao_times) is the pair (process time, perf counter time) of the counterexample
+    (resp. antichain optimization) algorithm.
+    """
+
+    # worker processes are forked with the same state for the random module, reseed so that random automata differ
+    random.seed()
+
+    if benchmark_type == "random":
+        print("-------------------- trying to generate the " + str(j) + "th automaton with " + str(i)
+              + "functions --------------------")
+
+        stats, aut, nbr, colors = random_automaton(parameters[0], parameters[1], i,  parameters[2],
+                                                   parameters[3], parameters[4], str(j))
+        gen_positivity = parameters[4]
+
+    elif benchmark_type == "intersection_vertices":
+        stats, aut, nbr, colors = intersection_example(i, negative_instance=not parameters[0])
+        gen_positivity = parameters[0]
+
+    elif benchmark_type == "intersection_objectives":
+        stats, aut, nbr, colors = intersection_example_objective_increase(i,
+                                                                          negative_instance=not parameters[0])
+        gen_positivity = parameters[0]
+
+    else:
+        raise BenchmarkNotSupportedError("This benchmark type is not supported.")
+
+    print(" ----- computing counterexample algorithm time -----")
+
+    positivity, process_time, perf_time = _run_in_fresh_process(counterexample_based_algorithm, aut, nbr, colors)
+
+    assert positivity == gen_positivity
+
+    ce_times = (round(process_time, 3), round(perf_time, 3))
+
+    print(" ----- computing antichain optimization time -----")
+
+    positivity, process_time, perf_time = _run_in_fresh_process(antichain_optimization_algorithm, aut, nbr, colors,
+                                                                is_payoff_realizable)
+
+    assert positivity == gen_positivity
+
+    ao_times = (round(process_time, 3), round(perf_time, 3))
+
+    return j, stats, nbr, ce_times, ao_times
+
+
+def _print_trial_results(j, stats, nbr, ce_times, ao_times):
+    """
+    Prints the statistics and running times of a trial, as returned by _run_one_trial.
+    """
+
+    print("----- results of the " + str(j) + "th trial -----")
+    print("Antichain sizes " + str(stats[0]))
+    print("Number of payoffs losing " + str(stats[1]))
+    print("Number of payoffs realizable " + str(stats[2]))
+
+    print("CE antichain sizes " + str(stats[3]))
+    print("CE exists calls " + str(stats[4][0]))
+    print("CE exists calls times " + str(round(stats[4][1].mean, 3)))
+    print("CE dominated calls " + str(stats[5][0]))
+    print("CE dominated calls times " + str(round(stats[5][1].mean, 3)))
+    print("CE total nbr calls " + str(stats[4][0] + stats[5][0]))
+
+    print("CE times process " + str(ce_times[0]))
+    print("CE times perf " + str(ce_times[1]))
+
+    print("AO antichain sizes " + str(stats[6]))
+    print("AO call1 calls " + str(stats[7][0]))
+    print("AO call1 calls times " + str(round(stats[7][1].mean, 3)))
+    print("AO call2 calls " + str(stats[8][0]))
+    print("AO call2 calls times " + str(round(stats[8][1].mean, 3)))
+    print("AO total nbr calls " + str(stats[7][0] + stats[8][0]))
+
+    print("AO times process " + str(ao_times[0]))
+    print("AO times perf " + str(ao_times[1]))
+
+
+def run_benchmark(benchmark_type, save_file, parameters, nbr_points, range_start, range_end, range_step,
+                  verbose=False, nbr_workers=None):
     """
     Runs several kinds of benchmarks. Given a set of fixed parameters in parameters, several values of some other
     variable are considered from range_start to range_end with a step of range_step. Given the parameters and a value
     for the variable in the range, the running time for both algorithms is evaluated nbr_points times. Consistency of
     the results from the algorithms is compared to the expected result given the benchmark being considered. The result
-    of the benchmarks are printed as they are obtained and saved to the file with path save_file. We consider three
-    types of benchmarks:
+    of the benchmarks are saved to the file with path save_file (and the results of each trial are printed as soon as
+    the trial is over if verbose is True).
+    We consider three types of benchmarks:
 
     - Random benchmarks:  when benchmark_type == "random", we evaluate the running time of the algorithms on random
     automata when increasing the number of objectives for Player 1 (with each function having 4 priorities). This number
@@ -60,206 +298,148 @@ def run_benchmark(benchmark_type, save_file, parameters, nbr_points, range_start
     :param range_start: start of the range for the variable being evaluated.
     :param range_end: end of the range for the variable being evaluated.
     :param range_step: step of the range for the variable being evaluated.
+    :param verbose: whether to print the statistics and running times of each run of the algorithms.
+    :param nbr_workers: number of trials run in parallel (by default, the number of cores the benchmarks are allowed to
+    run on). When several benchmarks are run concurrently, their numbers of workers should not add up to more than the
+    number of cores, otherwise the trials compete for the cores and the measured running times are inflated.
     """
-    for i in list(range(range_start, range_end, range_step)):
-
-        # lists to hold data for each of the nbr_points automata
-        temp_antichain_sizes = []
-        temp_nbr_payoffs_losing_player_0 = []
-        temp_nbr_payoffs_realizable = []
-
-        temp_counterexample_antichain_sizes = []
-        temp_counterexample_nbr_calls = []
-        temp_counterexample_nbr_calls_exists = []
-        temp_counterexample_mean_time_calls_exists = []
-        temp_counterexample_nbr_calls_dominated = []
-        temp_counterexample_mean_time_calls_dominated = []
-
-        temp_antichain_optimization_antichain_sizes = []
-        temp_antichain_optimization_nbr_calls = []
-        temp_antichain_optimization_nbr_calls1 = []
-        temp_antichain_optimization_mean_time_calls1 = []
-        temp_antichain_optimization_nbr_calls2 = []
-        temp_antichain_optimization_mean_time_calls2 = []
-
-        counterexample_times_process = []
-        antichain_optimization_times_process = []
-
-        counterexample_times_perf_counter = []
-        antichain_optimization_times_perf_counter = []
-
-        counterexample_times = []
-        antichain_optimization_times = []
-
-        for j in range(1, nbr_points + 1):
-
-            if benchmark_type == "random":
-                print("-------------------- trying to generate the " + str(j) + "th automaton with " + str(i)
-                      + "functions --------------------")
-
-                stats, aut, nbr, colors = random_automaton(parameters[0], parameters[1], i,  parameters[2],
-                                                           parameters[3], parameters[4], str(j))
-                gen_positivity = parameters[4]
-
-            elif benchmark_type == "intersection_vertices":
-                stats, aut, nbr, colors = intersection_example(i, negative_instance=not parameters[0])
-                gen_positivity = parameters[0]
-
-            elif benchmark_type == "intersection_objectives":
-                stats, aut, nbr, colors = intersection_example_objective_increase(i,
-                                                                                  negative_instance=not parameters[0])
-                gen_positivity = parameters[0]
-
-            else:
-                class BenchmarkNotSupportedError(Exception):
-                    pass
-
-                raise BenchmarkNotSupportedError("This benchmark type is not supported.")
-
-            temp_antichain_sizes.append(stats[0])
-            temp_nbr_payoffs_losing_player_0.append(stats[1])
-            temp_nbr_payoffs_realizable.append(stats[2])
-
-            temp_counterexample_antichain_sizes.append(stats[3])
-            temp_counterexample_nbr_calls_exists.append(stats[4][0])
-            temp_counterexample_mean_time_calls_exists.append(float("%.3f" % statistics.mean(stats[4][1])))
-            temp_counterexample_nbr_calls_dominated.append(stats[5][0])
-            temp_counterexample_mean_time_calls_dominated.append(float("%.3f" % statistics.mean(stats[5][1])))
-            temp_counterexample_nbr_calls.append(stats[4][0] + stats[5][0])
-
-            temp_antichain_optimization_antichain_sizes.append(stats[6])
-            temp_antichain_optimization_nbr_calls1.append(stats[7][0])
-            temp_antichain_optimization_mean_time_calls1.append(float("%.3f" % statistics.mean(stats[7][1])))
-            temp_antichain_optimization_nbr_calls2.append(stats[8][0])
-            temp_antichain_optimization_mean_time_calls2.append(float("%.3f" % statistics.mean(stats[8][1])))
-            temp_antichain_optimization_nbr_calls.append(stats[7][0] + stats[8][0])
-
-            print(" ----- computing counterexample algorithm time -----")
-
-            start_time_process = time.process_time()
-            start_time_perf = time.perf_counter()
-            start = time.time()
-
-            positivity = counterexample_based_algorithm(aut, nbr, colors)
-
-            end_time_process = time.process_time()
-            end_time_perf = time.perf_counter()
-            end = time.time()
-
-            assert positivity == gen_positivity
-
-            counterexample_times_process.append(float('%.3f' % (end_time_process - start_time_process)))
-            counterexample_times_perf_counter.append(float('%.3f' % (end_time_perf - start_time_perf)))
-            counterexample_times.append(float('%.3f' % (end - start)))
-
-            print(" ----- computing antichain optimization time -----")
-
-            start_time_process = time.process_time()
-            start_time_perf = time.perf_counter()
-            start = time.time()
-
-            positivity = antichain_optimization_algorithm(aut, nbr, colors, is_payoff_realizable)
-
-            end_time_process = time.process_time()
-            end_time_perf = time.perf_counter()
-            end = time.time()
-
-            assert positivity == gen_positivity
-
-            antichain_optimization_times_process.append(float('%.3f' % (end_time_process - start_time_process)))
-            antichain_optimization_times_perf_counter.append(float('%.3f' % (end_time_perf - start_time_perf)))
-            antichain_optimization_times.append(float('%.3f' % (end - start)))
-
-            print("Antichain sizes " + str(temp_antichain_sizes))
-            print("Number of payoffs losing " + str(temp_nbr_payoffs_losing_player_0))
-            print("Number of payoffs realizable " + str(temp_nbr_payoffs_realizable))
-
-            print("CE antichain sizes " + str(temp_counterexample_antichain_sizes))
-            print("CE exists calls " + str(temp_counterexample_nbr_calls_exists))
-            print("CE exists calls times " + str(temp_counterexample_mean_time_calls_exists))
-            print("CE dominated calls " + str(temp_counterexample_nbr_calls_dominated))
-            print("CE dominated calls times " + str(temp_counterexample_mean_time_calls_dominated))
-            print("CE total nbr calls " + str(temp_counterexample_nbr_calls))
-
-            print("CE times process " + str(counterexample_times_process))
-            print("CE times perf " + str(counterexample_times_perf_counter))
-
-            print("AO antichain sizes " + str(temp_antichain_optimization_antichain_sizes))
-            print("AO call1 calls " + str(temp_antichain_optimization_nbr_calls1))
-            print("AO call1 calls times " + str(temp_antichain_optimization_mean_time_calls1))
-            print("AO call2 calls " + str(temp_antichain_optimization_nbr_calls2))
-            print("AO call2 calls times " + str(temp_antichain_optimization_mean_time_calls2))
-            print("AO total nbr calls " + str(temp_antichain_optimization_nbr_calls))
-
-            print("AO times process " + str(antichain_optimization_times_process))
-            print("AO times perf " + str(antichain_optimization_times_perf_counter))
-
-        f = open(save_file, "a")
-
-        f.write("Variable value used " + str(i) + "\n")
-        f.write("Parameters " + str(parameters) + "\n")
-        f.write("Number of objectives " + str(nbr) + "\n")
-
-        f.write("Antichain sizes " + str(temp_antichain_sizes) + "\n")
-        f.write("Number of payoffs losing " + str(temp_nbr_payoffs_losing_player_0) + "\n")
-        f.write("Number of payoffs realizable " + str(temp_nbr_payoffs_realizable) + "\n")
-
-        f.write("CE antichain sizes " + str(temp_counterexample_antichain_sizes) + "\n")
-        f.write("CE exists calls " + str(temp_counterexample_nbr_calls_exists) + "\n")
-        f.write("CE exists calls times " + str(temp_counterexample_mean_time_calls_exists) + "\n")
-        f.write("CE dominated calls " + str(temp_counterexample_nbr_calls_dominated) + "\n")
-        f.write("CE dominated calls times " + str(temp_counterexample_mean_time_calls_dominated) + "\n")
-        f.write("CE total nbr calls " + str(temp_counterexample_nbr_calls) + "\n")
-
-        f.write("CE times process " + str(counterexample_times_process) + "\n")
-        f.write("CE times perf " + str(counterexample_times_perf_counter) + "\n")
-        f.write("CE times " + str(counterexample_times) + "\n")
-
-        f.write("AO antichain sizes " + str(temp_antichain_optimization_antichain_sizes) + "\n")
-        f.write("AO call1 calls " + str(temp_antichain_optimization_nbr_calls1) + "\n")
-        f.write("AO call1 calls times " + str(temp_antichain_optimization_mean_time_calls1) + "\n")
-        f.write("AO call2 calls " + str(temp_antichain_optimization_nbr_calls2) + "\n")
-        f.write("AO call2 calls times " + str(temp_antichain_optimization_mean_time_calls2) + "\n")
-        f.write("AO total nbr calls " + str(temp_antichain_optimization_nbr_calls) + "\n")
-
-        f.write("AO times process " + str(antichain_optimization_times_process) + "\n")
-        f.write("AO times perf " + str(antichain_optimization_times_perf_counter) + "\n")
-        f.write("AO times " + str(antichain_optimization_times) + "\n")
-
-        f.write("Mean running time CE " + "%.3f" % statistics.mean(counterexample_times_process) + ", ")
-        f.write("%.3f" % statistics.mean(counterexample_times_perf_counter) + ", ")
-        f.write("%.3f" % statistics.mean(counterexample_times) + "\n")
-
-        f.write("Mean running time AO " + "%.3f" % statistics.mean(antichain_optimization_times_process) + ", ")
-        f.write("%.3f" % statistics.mean(antichain_optimization_times_perf_counter) + ", ")
-        f.write("%.3f" % statistics.mean(antichain_optimization_times) + "\n")
-
-        f.write("Mean antichain size " + "%.3f" % statistics.mean(temp_antichain_sizes) + "\n")
-        f.write("Mean number losing payoffs " + "%.3f" % statistics.mean(temp_nbr_payoffs_losing_player_0) + "\n")
-        f.write("Mean number realizable payoffs " + "%.3f" % statistics.mean(temp_nbr_payoffs_realizable) + "\n")
-
-        f.write("CE mean antichain size " + "%.3f" % statistics.mean(temp_counterexample_antichain_sizes) + "\n")
-        f.write("CE mean nbr exists calls " + "%.3f" % statistics.mean(temp_counterexample_nbr_calls_exists) + "\n")
-        f.write("CE mean exists time " + "%.3f" % statistics.mean(temp_counterexample_mean_time_calls_exists) + "\n")
-        f.write("CE mean nbr dominated calls " + "%.3f" % statistics.mean(temp_counterexample_nbr_calls_dominated) +
-                "\n")
-        f.write("CE mean dominated time " + "%.3f" % statistics.mean(temp_counterexample_mean_time_calls_dominated) +
-                "\n")
-        f.write("CE mean total nbr calls " + "%.3f" % statistics.mean(temp_counterexample_nbr_calls) + "\n")
-
-        f.write("AO mean antichain size " + "%.3f" % statistics.mean(temp_antichain_optimization_antichain_sizes) +
-                "\n")
-        f.write("AO mean nbr call1 calls " + "%.3f" % statistics.mean(temp_antichain_optimization_nbr_calls1) + "\n")
-        f.write("AO mean call1 time " + "%.3f" % statistics.mean(temp_antichain_optimization_mean_time_calls1) + "\n")
-        f.write("AO mean nbr call2 calls " + "%.3f" % statistics.mean(temp_antichain_optimization_nbr_calls2) + "\n")
-        f.write("AO mean call2 time " + "%.3f" % statistics.mean(temp_antichain_optimization_mean_time_calls2) + "\n")
-        f.write("AO mean total nbr calls " + "%.3f" % statistics.mean(temp_antichain_optimization_nbr_calls) + "\n")
-
-        f.write("\n")
-        f.write("\n")
-        f.write("\n")
-
-        f.close()
+    # checked before any trial is submitted to the workers
+    if benchmark_type not in ["random", "intersection_vertices", "intersection_objectives"]:
+        raise BenchmarkNotSupportedError("This benchmark type is not supported.")
+
+    if nbr_workers is None:
+        nbr_workers = _nbr_available_cores()
+
+    # the workers of a ProcessPoolExecutor (unlike those of a multiprocessing.Pool) are not daemonic and can therefore
+    # fork the processes running the algorithms
+    with ProcessPoolExecutor(nbr_workers) as executor:
+
+        for i in range(range_start, range_end, range_step):
+
+            # lists to hold data for each of the nbr_points automata
+            temp_antichain_sizes = []
+            temp_nbr_payoffs_losing_player_0 = []
+            temp_nbr_payoffs_realizable = []
+
+            temp_counterexample_antichain_sizes = []
+            temp_counterexample_nbr_calls = []
+            temp_counterexample_nbr_calls_exists = []
+            temp_counterexample_mean_time_calls_exists = []
+            temp_counterexample_nbr_calls_dominated = []
+            temp_counterexample_mean_time_calls_dominated = []
+
+            temp_antichain_optimization_antichain_sizes = []
+            temp_antichain_optimization_nbr_calls = []
+            temp_antichain_optimization_nbr_calls1 = []
+            temp_antichain_optimization_mean_time_calls1 = []
+            temp_antichain_optimization_nbr_calls2 = []
+            temp_antichain_optimization_mean_time_calls2 = []
+
+            counterexample_times_process = []
+            antichain_optimization_times_process = []
+
+            counterexample_times_perf_counter = []
+            antichain_optimization_times_perf_counter = []
+
+            # the nbr_points trials are independent and are run in parallel
+            trials = {executor.submit(_run_one_trial, j, benchmark_type, parameters, i): j
+                      for j in range(1, nbr_points + 1)}
+
+            # the results of the trials are printed as soon as they are obtained but stored in order of trial index
+            results = [None] * nbr_points
+            try:
+                for trial in as_completed(trials):
+                    result = trial.result()
+                    results[trials[trial] - 1] = result
+                    if verbose:
+                        _print_trial_results(*result)
+            finally:
+                # if a trial failed, the trials which have not started yet are not run
+                for trial in trials:
+                    trial.cancel()
+
+            for j, stats, nbr, ce_times, ao_times in results:
+
+                temp_antichain_sizes.append(stats[0])
+                temp_nbr_payoffs_losing_player_0.append(stats[1])
+                temp_nbr_payoffs_realizable.append(stats[2])
+
+                temp_counterexample_antichain_sizes.append(stats[3])
+                temp_counterexample_nbr_calls_exists.append(stats[4][0])
+                temp_counterexample_mean_time_calls_exists.append(round(stats[4][1].mean, 3))
+                temp_counterexample_nbr_calls_dominated.append(stats[5][0])
+                temp_counterexample_mean_time_calls_dominated.append(round(stats[5][1].mean, 3))
+                temp_counterexample_nbr_calls.append(stats[4][0] + stats[5][0])
+
+                temp_antichain_optimization_antichain_sizes.append(stats[6])
+                temp_antichain_optimization_nbr_calls1.append(stats[7][0])
+                temp_antichain_optimization_mean_time_calls1.append(round(stats[7][1].mean, 3))
+                temp_antichain_optimization_nbr_calls2.append(stats[8][0])
+                temp_antichain_optimization_mean_time_calls2.append(round(stats[8][1].mean, 3))
+                temp_antichain_optimization_nbr_calls.append(stats[7][0] + stats[8][0])
+
+                counterexample_times_process.append(ce_times[0])
+                counterexample_times_perf_counter.append(ce_times[1])
+
+                antichain_optimization_times_process.append(ao_times[0])
+                antichain_optimization_times_perf_counter.append(ao_times[1])
+
+            report = "\n".join([
+                f"Variable value used {i}",
+                f"Parameters {parameters}",
+                f"Number of objectives {nbr}",
+
+                f"Antichain sizes {temp_antichain_sizes}",
+                f"Number of payoffs losing {temp_nbr_payoffs_losing_player_0}",
+                f"Number of payoffs realizable {temp_nbr_payoffs_realizable}",
+
+                f"CE antichain sizes {temp_counterexample_antichain_sizes}",
+                f"CE exists calls {temp_counterexample_nbr_calls_exists}",
+                f"CE exists calls times {temp_counterexample_mean_time_calls_exists}",
+                f"CE dominated calls {temp_counterexample_nbr_calls_dominated}",
+                f"CE dominated calls times {temp_counterexample_mean_time_calls_dominated}",
+                f"CE total nbr calls {temp_counterexample_nbr_calls}",
+
+                f"CE times process {counterexample_times_process}",
+                f"CE times perf {counterexample_times_perf_counter}",
+
+                f"AO antichain sizes {temp_antichain_optimization_antichain_sizes}",
+                f"AO call1 calls {temp_antichain_optimization_nbr_calls1}",
+                f"AO call1 calls times {temp_antichain_optimization_mean_time_calls1}",
+                f"AO call2 calls {temp_antichain_optimization_nbr_calls2}",
+                f"AO call2 calls times {temp_antichain_optimization_mean_time_calls2}",
+                f"AO total nbr calls {temp_antichain_optimization_nbr_calls}",
+
+                f"AO times process {antichain_optimization_times_process}",
+                f"AO times perf {antichain_optimization_times_perf_counter}",
+
+                f"Mean running time CE {statistics.fmean(counterexample_times_process):.3f}, "
+                f"{statistics.fmean(counterexample_times_perf_counter):.3f}",
+                f"Mean running time AO {statistics.fmean(antichain_optimization_times_process):.3f}, "
+                f"{statistics.fmean(antichain_optimization_times_perf_counter):.3f}",
+
+                f"Mean antichain size {statistics.fmean(temp_antichain_sizes):.3f}",
+                f"Mean number losing payoffs {statistics.fmean(temp_nbr_payoffs_losing_player_0):.3f}",
+                f"Mean number realizable payoffs {statistics.fmean(temp_nbr_payoffs_realizable):.3f}",
+
+                f"CE mean antichain size {statistics.fmean(temp_counterexample_antichain_sizes):.3f}",
+                f"CE mean nbr exists calls {statistics.fmean(temp_counterexample_nbr_calls_exists):.3f}",
+                f"CE mean exists time {statistics.fmean(temp_counterexample_mean_time_calls_exists):.3f}",
+                f"CE mean nbr dominated calls {statistics.fmean(temp_counterexample_nbr_calls_dominated):.3f}",
+                f"CE mean dominated time {statistics.fmean(temp_counterexample_mean_time_calls_dominated):.3f}",
+                f"CE mean total nbr calls {statistics.fmean(temp_counterexample_nbr_calls):.3f}",
+
+                f"AO mean antichain size {statistics.fmean(temp_antichain_optimization_antichain_sizes):.3f}",
+                f"AO mean nbr call1 calls {statistics.fmean(temp_antichain_optimization_nbr_calls1):.3f}",
+                f"AO mean call1 time {statistics.fmean(temp_antichain_optimization_mean_time_calls1):.3f}",
+                f"AO mean nbr call2 calls {statistics.fmean(temp_antichain_optimization_nbr_calls2):.3f}",
+                f"AO mean call2 time {statistics.fmean(temp_antichain_optimization_mean_time_calls2):.3f}",
+                f"AO mean total nbr calls {statistics.fmean(temp_antichain_optimization_nbr_calls):.3f}"
+            ]) + "\n\n\n\n"
+
+            f = open(save_file, "a")
+            f.write(report)
+            f.close()
 
 
 def get_counterexample_statistics(automaton_path, nbr_objectives, colors_map, save_file):
@@ -279,12 +459,12 @@ def get_counterexample_statistics(automaton_path, nbr_objectives, colors_map, sa
         for u in spot.automata(automaton_path):
             automaton = u
 
-    _, _, ce_exists_stats, _, antichain_evol = counterexample_based_statistics(automaton, nbr_objectives, colors_map)
+    _, _, _, _, antichain_evol = counterexample_based_statistics(automaton, nbr_objectives, colors_map)
 
     f = open(save_file, "a")
     f.write("iteration A_size call_time\n")
     for i in range(len(antichain_evol)):
-        f.write(str(i) + " " + str(antichain_evol[i]) + " " + str("%.4f" % ce_exists_stats[1][i]) + "\n")
+        f.write(str(i) + " " + str(antichain_evol[i][0]) + " " + str("%.4f" % antichain_evol[i][1]) + "\n")
     f.close()
 
 
@@ -293,7 +473,8 @@ def parse_results(file_name, benchmark_type, nbr_points, save_file):
     Parse the results contained in the file file_name (which is the output of run_benchmark) and creates a .dat file
     save_file containing the running time of both algorithms for each value of the variable being tested and for each
     of the nbr_points runs of the algorithms. In addition, when benchmark_type is "random", we also report the mean
-    running time of each algorithm on the nbr_points runs for each value of the variable.
+    running time of each algorithm on the nbr_points runs for each value of the variable. Running times are the ones
+    measured with the perf counter.
     :param file_name: file containing benchmarks data (output of run_benchmark).
     :param benchmark_type: should be in ["random", "intersection_vertices", "intersection_objectives"].
     :param nbr_points: number of times the algorithms are evaluated given a set of parameters.
@@ -306,63 +487,110 @@ def parse_results(file_name, benchmark_type, nbr_points, save_file):
     mean_y_ce = []
     mean_y_ao = []
 
+    def parse_variable(tail):
+        current_x = int(tail)
+        if benchmark_type == "intersection_objectives":
+            current_x = 2 + current_x * 2
+        x.extend([current_x] * nbr_points)
+
+    def parse_times(values):
+        return lambda tail: values.extend(json.loads(tail)[:nbr_points])
+
+    def parse_mean_time(values):
+        return lambda tail: values.extend([float(json.loads("[" + tail + "]")[1])] * nbr_points)
+
+    # maps the beginning of the relevant lines to the function parsing the rest of the line
+    handlers = {
+        "Variable value used ": parse_variable,
+        "CE times perf ": parse_times(y_ce),
+        "AO times perf ": parse_times(y_ao)
+    }
+
+    if benchmark_type == "random":
+        handlers["Mean running time CE "] = parse_mean_time(mean_y_ce)
+        handlers["Mean running time AO "] = parse_mean_time(mean_y_ao)
+
     with open(file_name, "r") as search:
 
         for line in search:
 
-            line = line.rstrip().split(" ")
-            if line[0] == "Variable" and line[1] == "value" and line[2] == "used":
-                current_x = int(line[3])
-                for i in range(nbr_points):
-                    if benchmark_type == "intersection_vertices":
-                        x.append(current_x)
-                    if benchmark_type == "intersection_objectives":
-                        x.append(2 + current_x * 2)
-                    if benchmark_type == "random":
-                        x.append(current_x)
-
-            if line[0] == "CE" and line[1] == "times" and line[2] == "process":
-                current_ce_times = ast.literal_eval(" ".join(line[3:]))
-                for i in range(nbr_points):
-                    y_ce.append(current_ce_times[i])
-
-            if line[0] == "AO" and line[1] == "times" and line[2] == "process":
-                current_ao_times = ast.literal_eval(" ".join(line[3:]))
-                for i in range(nbr_points):
-                    y_ao.append(current_ao_times[i])
-
-
-            if benchmark_type == "random":
-                if line[0] == "Mean" and line[1] == "running" and line[2] == "time" and line[3] == "CE":
-                    current_mean_y_ce = ast.literal_eval(" ".join(line[4:]))
-                    for i in range(nbr_points):
-                        mean_y_ce.append(float(current_mean_y_ce[0]))
-
-                if line[0] == "Mean" and line[1] == "running" and line[2] == "time" and line[3] == "AO":
-                    current_mean_y_ao = ast.literal_eval(" ".join(line[4:]))
-                    for i in range(nbr_points):
-                        mean_y_ao.append(float(current_mean_y_ao[0]))
+            line = line.rstrip()
+
+            for prefix, handler in handlers.items():
+
+                if line.startswith(prefix):
+                    handler(line[len(prefix):])
+                    break
 
-    f = open(save_file, "a")
     if benchmark_type == "intersection_vertices":
-        f.write("nbr_vertices CE_time AO_time\n")
-        for i in range(len(x)):
-            f.write(str(x[i]) + " " + str(y_ce[i]) + " " + str(y_ao[i]) + "\n")
+        header = "nbr_vertices CE_time AO_time"
+        columns = [x, y_ce, y_ao]
 
     if benchmark_type == "intersection_objectives":
-        f.write("nbr_objectives CE_time AO_time\n")
-        for i in range(len(x)):
-            f.write(str(x[i]) + " " + str(y_ce[i]) + " " + str(y_ao[i]) + "\n")
+        header = "nbr_objectives CE_time AO_time"
+        columns = [x, y_ce, y_ao]
 
     if benchmark_type == "random":
-        f.write("nbr_objectives CE_time AO_time mean_CE_time mean_AO_time\n")
-        for i in range(len(x)):
-            f.write(str(x[i]) + " " + str(y_ce[i]) + " " + str(y_ao[i]) + " " + str(mean_y_ce[i]) + " " +
-                    str(mean_y_ao[i]) + "\n")
+        header = "nbr_objectives CE_time AO_time mean_CE_time mean_AO_time"
+        columns = [x, y_ce, y_ao, mean_y_ce, mean_y_ao]
 
+    # the rows are built column-wise and written at once
+    rows = [header] + [" ".join(map(str, row)) for row in zip(*columns)]
+
+    f = open(save_file, "a")
+    f.write("\n".join(rows) + "\n")
     f.close()
 
 
+def _schedule_benchmarks(benchmarks, nbr_cores):
+    """
+    Split the benchmarks into batches of benchmarks run concurrently and choose the number of workers of each benchmark,
+    so that the numbers of workers in a batch never add up to more than nbr_cores. Each benchmark gets one worker, and
+    the remaining cores of a batch are given to the benchmarks with the most trials (a benchmark never gets more workers
+    than its number of trials nbr_points, since the trials of different values of the variable are run one after the
+    other).
+    :param benchmarks: the benchmarks, each given by the arguments of run_benchmark.
+    :param nbr_cores: the number of cores available to run the benchmarks.
+    :return: the list of batches, each of them being a list of pairs (benchmark, number of workers).
+    """
+
+    batches = []
+
+    for start in range(0, len(benchmarks), nbr_cores):
+
+        batch = benchmarks[start:start + nbr_cores]
+        nbr_workers = [1] * len(batch)
+        remaining_cores = nbr_cores - len(batch)
+
+        # benchmarks with the most trials first
+        order = sorted(range(len(batch)), key=lambda k: batch[k][3], reverse=True)
+
+        while remaining_cores > 0:
+
+            candidates = [k for k in order if nbr_workers[k] < batch[k][3]]
+            if not candidates:
+                break
+
+            for k in candidates[:remaining_cores]:
+                nbr_workers[k] += 1
+                remaining_cores -= 1
+
+        batches.append(list(zip(batch, nbr_workers)))
+
+    return batches
+
+
+def _parse_benchmark_results(benchmark):
+    """
+    Parse the results of a benchmark run with run_benchmark. The .dat file is saved next to the results of the
+    benchmark, with the same name.
+    :param benchmark: the arguments with which run_benchmark was called.
+    """
+
+    benchmark_type, save_file, _, nbr_points = benchmark[:4]
+    parse_results(save_file, benchmark_type, nbr_points, os.path.splitext(save_file)[0] + ".dat")
+
+
 def generate_tables(file_name):
     """
     Parse the results contained in the file file_name (which is the output of run_benchmark) and prints the latex table
@@ -391,17 +619,20 @@ def generate_tables(file_name):
         "AO mean antichain size": "$|A|$ in Algorithm \\ref{algo:fpt-CE}"
     }
 
-    for pattern in dict_pattern.keys():
+    # the file is read once, each line being checked against all patterns
+    with open(file_name, "r") as search:
 
-        with open(file_name, "r") as search:
+        for line in search:
 
-            for line in search:
+            line = line.rstrip()
 
-                line = line.rstrip().split(pattern)
+            for pattern, values in dict_pattern.items():
 
-                if len(line) == 2:
-                    dict_pattern[pattern].append(line[1])
+                if line.startswith(pattern + " "):
+                    values.append(line[len(pattern) + 1:])
+                    break
 
+    for pattern in dict_pattern.keys():
         dict_pattern[pattern] = list(reversed(dict_pattern[pattern]))
 
     nbr_elements = len(dict_pattern["Mean number realizable payoffs"])
@@ -418,97 +649,73 @@ def generate_tables(file_name):
             print(current_list[i].strip() + " & ", end=" ")
         print(current_list[nbr_elements - 1].strip() + " \\\\")
 
+    ratios = [float(losing) / float(realizable) for losing, realizable in
+              zip(dict_pattern["Mean number losing payoffs"], dict_pattern["Mean number realizable payoffs"])]
     print("Ratio of lost payoffs" + " & ", end=" ")
-    nbr_elements = len(dict_pattern["Mean number realizable payoffs"])
-    for i in range(nbr_elements - 1):
-        print("%.3f" % (float(list(dict_pattern["Mean number losing payoffs"])[i]) / float(list(
-            dict_pattern["Mean number realizable payoffs"])[i])) + " & ", end=" ")
-    print("%.3f" % (float(list(dict_pattern["Mean number losing payoffs"])[nbr_elements - 1]) / float(list(
-        dict_pattern["Mean number realizable payoffs"])[nbr_elements - 1])) + " \\\\")
-
-
-run_benchmark("intersection_vertices",
-              "benchmarks_results/intersection-vertices-positive.txt",
-              [True],
-              1,
-              100000, 0, -1000)
-
-parse_results("benchmarks_results/intersection-vertices-positive.txt",
-              "intersection_vertices",
-              1,
-              "benchmarks_results/intersection-vertices-positive.dat")
-
-run_benchmark("intersection_vertices",
-              "benchmarks_results/intersection-vertices-negative.txt",
-              [False],
-              1,
-              100000, 0, -1000)
-
-parse_results("benchmarks_results/intersection-vertices-negative.txt",
-              "intersection_vertices",
-              1,
-              "benchmarks_results/intersection-vertices-negative.dat")
-
-run_benchmark("intersection_objectives",
-              "benchmarks_results/intersection-objectives-positive.txt",
-              [True],
-              1,
-              10, 1, -1)
-
-parse_results("benchmarks_results/intersection-objectives-positive.txt",
-              "intersection_objectives",
-              1,
-              "benchmarks_results/intersection-objectives-positive.dat")
-
-run_benchmark("intersection_objectives",
-              "benchmarks_results/intersection-objectives-negative.txt",
-              [False],
-              1,
-              10, 1, -1)
-
-parse_results("benchmarks_results/intersection-objectives-negative.txt",
-              "intersection_objectives",
-              1,
-              "benchmarks_results/intersection-objectives-negative.dat")
-
-run_benchmark("random",
-              "benchmarks_results/random-positive.txt",
-              [500, 0.2, 0.2, 0.1, True],
-              50,
-              15, 5, -1)
-
-parse_results("benchmarks_results/random-positive.txt",
-              "random",
-              50,
-              "benchmarks_results/random-positive.dat")
-
-run_benchmark("random",
-              "benchmarks_results/random-negative.txt",
-              [500, 0.2, 0.1, 0.5, False],
-              50,
-              15, 6, -1)
-
-parse_results("benchmarks_results/random-negative.txt",
-              "random",
-              50,
-              "benchmarks_results/random-negative.dat")
-
-colors_map = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7], 2: [8, 9, 10, 11], 3: [12, 13, 14, 15],
-              4: [16, 17, 18, 19], 5: [20, 21, 22, 23], 6: [24, 25, 26, 27], 7: [28, 29, 30, 31],
-              8: [32, 33, 34, 35], 9: [36, 37, 38, 39], 10: [40, 41, 42, 43], 11: [44, 45, 46, 47],
-              12: [48, 49, 50, 51], 13: [52, 53, 54, 55], 14: [56, 57, 58, 59], 15: [60, 61, 62, 63]}
-
-get_counterexample_statistics("random_automata/random-500-0.2-15-0.2-0.1-True-11.hoa",
-                              15,
-                              colors_map,
-                              "benchmarks_results/CE_difficult_positive.dat")
-
-colors_map = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7], 2: [8, 9, 10, 11], 3: [12, 13, 14, 15],
-              4: [16, 17, 18, 19], 5: [20, 21, 22, 23], 6: [24, 25, 26, 27], 7: [28, 29, 30, 31],
-              8: [32, 33, 34, 35], 9: [36, 37, 38, 39], 10: [40, 41, 42, 43], 11: [44, 45, 46, 47],
-              12: [48, 49, 50, 51], 13: [52, 53, 54, 55], 14: [56, 57, 58, 59]}
-
-get_counterexample_statistics("random_automata/random-500-0.2-14-0.1-0.5-False-27.hoa",
-                                    14,
-                                    colors_map,
-                                    "benchmarks_results/CE_difficult_negative.dat")
+    print(" &  ".join(f"{ratio:.3f}" for ratio in ratios) + " \\\\")
+
+
+if __name__ == "__main__":
+    previous_env = _setup_measurement_env()
+
+    try:
+        # each benchmark is given by the arguments of run_benchmark
+        benchmarks = [
+            ("intersection_vertices", "benchmarks_results/intersection-vertices-positive.txt", [True], 1,
+             100000, 0, -1000),
+            ("intersection_vertices", "benchmarks_results/intersection-vertices-negative.txt", [False], 1,
+             100000, 0, -1000),
+            ("intersection_objectives", "benchmarks_results/intersection-objectives-positive.txt", [True], 1,
+             10, 1, -1),
+            ("intersection_objectives", "benchmarks_results/intersection-objectives-negative.txt", [False], 1,
+             10, 1, -1),
+            ("random", "benchmarks_results/random-positive.txt", [500, 0.2, 0.2, 0.1, True], 50,
+             15, 5, -1),
+            ("random", "benchmarks_results/random-negative.txt", [500, 0.2, 0.1, 0.5, False], 50,
+             15, 6, -1)
+        ]
+
+        # the benchmarks are independent and the benchmarks of a batch are run concurrently, the results of each of
+        # them are parsed as soon as it is over. The cores are shared between the benchmarks of a batch so that their
+        # trials do not compete for the same cores. A failed benchmark does not prevent the others from being run and
+        # parsed, the first failure is raised once all benchmarks are over.
+        failures = []
+        for batch in _schedule_benchmarks(benchmarks, _nbr_available_cores()):
+
+            with ProcessPoolExecutor(max_workers=len(batch)) as executor:
+                futures = {executor.submit(run_benchmark, *benchmark, nbr_workers=nbr_workers): benchmark
+                           for benchmark, nbr_workers in batch}
+
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                        _parse_benchmark_results(futures[future])
+                    except Exception as exception:
+                        print("--- benchmark " + futures[future][1] + " failed: " + repr(exception) + " ---")
+                        failures.append(exception)
+
+        if failures:
+            raise failures[0]
+
+        colors_map = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7], 2: [8, 9, 10, 11], 3: [12, 13, 14, 15],
+                      4: [16, 17, 18, 19], 5: [20, 21, 22, 23], 6: [24, 25, 26, 27], 7: [28, 29, 30, 31],
+                      8: [32, 33, 34, 35], 9: [36, 37, 38, 39], 10: [40, 41, 42, 43], 11: [44, 45, 46, 47],
+                      12: [48, 49, 50, 51], 13: [52, 53, 54, 55], 14: [56, 57, 58, 59], 15: [60, 61, 62, 63]}
+
+        get_counterexample_statistics("random_automata/random-500-0.2-15-0.2-0.1-True-11.hoa",
+                                      15,
+                                      colors_map,
+                                      "benchmarks_results/CE_difficult_positive.dat")
+
+        colors_map = {0: [0, 1, 2, 3], 1: [4, 5, 6, 7], 2: [8, 9, 10, 11], 3: [12, 13, 14, 15],
+                      4: [16, 17, 18, 19], 5: [20, 21, 22, 23], 6: [24, 25, 26, 27], 7: [28, 29, 30, 31],
+                      8: [32, 33, 34, 35], 9: [36, 37, 38, 39], 10: [40, 41, 42, 43], 11: [44, 45, 46, 47],
+                      12: [48, 49, 50, 51], 13: [52, 53, 54, 55], 14: [56, 57, 58, 59]}
+
+        get_counterexample_statistics("random_automata/random-500-0.2-14-0.1-0.5-False-27.hoa",
+                                            14,
+                                            colors_map,
+                                            "benchmarks_results/CE_difficult_negative.dat")
+
+    finally:
+        _restore_measurement_env(previous_env)